@@ -5,7 +5,7 @@ This module provides custom Django model fields that integrate seamlessly
 with Cloudflare Images, handling upload URLs, validation, and image management.
 """
 
-from typing import Any, Optional
+from typing import Any
 
 from django import forms
 from django.core.exceptions import ValidationError
@@ -68,7 +68,7 @@ class CloudflareImageField(models.Field):
         """Return the internal field type for Django."""
         return "CharField"
 
-    def to_python(self, value: Any) -> Optional["CloudflareImageFieldValue"]:
+    def to_python(self, value: Any) -> "CloudflareImageFieldValue | None":
         """
         Convert the database value to a Python object.
 
@@ -95,7 +95,7 @@ class CloudflareImageField(models.Field):
 
     def from_db_value(
         self, value: Any, expression, connection
-    ) -> Optional["CloudflareImageFieldValue"]:
+    ) -> "CloudflareImageFieldValue | None":
         """Convert database value to Python object."""
         return self.to_python(value)
 
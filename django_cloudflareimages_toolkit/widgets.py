@@ -20,14 +20,16 @@ The upload endpoint is resolved from its named route
 source of truth for that URL is its ``path()`` definition (see issue #22).
 """
 
-from typing import Any
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any, NamedTuple
 
 from django import forms
 from django.forms.renderers import get_default_renderer
 from django.template import TemplateDoesNotExist
 from django.urls import NoReverseMatch, reverse
 from django.utils.html import format_html, json_script
-from django.utils.safestring import SafeText, mark_safe
+from django.utils.safestring import SafeString, mark_safe
 
 from .constants import DEFAULT_ALLOWED_FORMATS
 
@@ -36,6 +38,52 @@ from .constants import DEFAULT_ALLOWED_FORMATS
 # to the real endpoint and remounting/renaming the URL propagates automatically.
 UPLOAD_URL_NAME = "cloudflare_images:create-upload-url"
 
+# Markup emitted by ``_render_fallback`` -- the same structure as the widget
+# template, kept beside the other module constants so the method body stays
+# short. ``format_html`` escapes every placeholder it fills in.
+_FALLBACK_HTML = (
+    '<div class="cloudflare-image-upload-container" '
+    'data-cfimg-field="{field_id}">'
+    '<input type="hidden" name="{name}" id="{field_id}" value="{value}" '
+    'class="cloudflare-image-field">'
+    '<input type="file" id="{upload_id}" accept="image/*" '
+    'class="cloudflare-image-upload">'
+    '<div id="{preview_id}" class="cloudflare-image-preview"></div>'
+    '<div id="{progress_id}" class="cloudflare-image-progress" '
+    'style="display: none;">'
+    '<div class="progress-bar"></div>'
+    '<span class="progress-text">Uploading…</span>'
+    "</div>{config_script}</div>"
+)
+
+
+def _freeze_names(
+    value: list[str] | tuple[str, ...] | None, default: tuple[str, ...] = ()
+) -> tuple[str, ...]:
+    """Copy a list of variant/format names into a tuple.
+
+    A bare ``str`` is rejected rather than silently split into characters
+    (``"thumb"`` -> ``("t", "h", ...)``).
+    """
+    if isinstance(value, str):
+        raise TypeError(f"expected a list of names, not the string {value!r}")
+    return tuple(value or default)
+
+
+class _WidgetConfig(NamedTuple):
+    """The construction-time options the widget's ``config`` payload is built
+    from, normalized once on construction or assignment.
+
+    ``metadata`` is a private plain-dict copy (a mappingproxy can't be pickled
+    or deep-copied); the widget only ever exposes it through a read-only view.
+    """
+
+    variants: tuple[str, ...]
+    metadata: dict[str, Any]
+    require_signed_urls: bool
+    max_file_size: int | None
+    allowed_formats: tuple[str, ...]
+
 
 class CloudflareImageWidget(forms.TextInput):
     """
@@ -54,31 +102,36 @@ class CloudflareImageWidget(forms.TextInput):
 
     def __init__(
         self,
-        variants: list[str] | None = None,
-        metadata: dict[str, Any] | None = None,
+        variants: list[str] | tuple[str, ...] | None = None,
+        metadata: Mapping[str, Any] | None = None,
         require_signed_urls: bool = False,
         max_file_size: int | None = None,
-        allowed_formats: list[str] | None = None,
+        allowed_formats: list[str] | tuple[str, ...] | None = None,
         attrs: dict[str, Any] | None = None,
     ):
         """
         Initialize the widget.
 
         Args:
-            variants: List of image variants to create
+            variants: Image variants to create
             metadata: Default metadata for uploads
             require_signed_urls: Whether to require signed URLs
             max_file_size: Maximum file size in bytes
-            allowed_formats: List of allowed image formats
+            allowed_formats: Allowed image formats
             attrs: Additional HTML attributes
         """
-        self.variants = variants or []
-        self.metadata = metadata or {}
-        self.require_signed_urls = require_signed_urls
-        self.max_file_size = max_file_size
-        # Copy the shared default so the constant is never mutated through a
-        # widget instance (and instances don't accidentally share one list).
-        self.allowed_formats = allowed_formats or list(DEFAULT_ALLOWED_FORMATS)
+        # Copied into immutable containers, so neither the caller's objects nor
+        # the shared default can be mutated through (or leak into) a widget
+        # instance, including the copies Django makes per form.
+        self._cfg = _WidgetConfig(
+            variants=_freeze_names(variants),
+            metadata=dict(metadata or {}),
+            require_signed_urls=require_signed_urls,
+            max_file_size=max_file_size,
+            allowed_formats=_freeze_names(
+                allowed_formats, tuple(DEFAULT_ALLOWED_FORMATS)
+            ),
+        )
 
         default_attrs = {"type": "hidden", "class": "cloudflare-image-field"}
         if attrs:
@@ -86,6 +139,52 @@ class CloudflareImageWidget(forms.TextInput):
 
         super().__init__(attrs=default_attrs)
 
+    # These properties exist only so that assigning an option re-applies the
+    # same copy/freeze as __init__; plain attributes would let
+    # ``widget.variants = some_list`` bypass it. They are not a speed-up.
+
+    @property
+    def variants(self) -> tuple[str, ...]:
+        return self._cfg.variants
+
+    @variants.setter
+    def variants(self, value: list[str] | tuple[str, ...] | None) -> None:
+        self._cfg = self._cfg._replace(variants=_freeze_names(value))
+
+    @property
+    def metadata(self) -> Mapping[str, Any]:
+        return MappingProxyType(self._cfg.metadata)
+
+    @metadata.setter
+    def metadata(self, value: Mapping[str, Any] | None) -> None:
+        self._cfg = self._cfg._replace(metadata=dict(value or {}))
+
+    @property
+    def require_signed_urls(self) -> bool:
+        return self._cfg.require_signed_urls
+
+    @require_signed_urls.setter
+    def require_signed_urls(self, value: bool) -> None:
+        self._cfg = self._cfg._replace(require_signed_urls=value)
+
+    @property
+    def max_file_size(self) -> int | None:
+        return self._cfg.max_file_size
+
+    @max_file_size.setter
+    def max_file_size(self, value: int | None) -> None:
+        self._cfg = self._cfg._replace(max_file_size=value)
+
+    @property
+    def allowed_formats(self) -> tuple[str, ...]:
+        return self._cfg.allowed_formats
+
+    @allowed_formats.setter
+    def allowed_formats(self, value: list[str] | tuple[str, ...] | None) -> None:
+        self._cfg = self._cfg._replace(
+            allowed_formats=_freeze_names(value, tuple(DEFAULT_ALLOWED_FORMATS))
+        )
+
     def format_value(self, value):
         """Format the field value for display."""
         if value is None:
@@ -111,12 +210,15 @@ class CloudflareImageWidget(forms.TextInput):
         :meth:`render` and :meth:`_render_fallback` can never serialize a
         different payload.
         """
+        cfg = self._cfg
         return {
-            "variants": self.variants,
-            "metadata": self.metadata,
-            "require_signed_urls": self.require_signed_urls,
-            "max_file_size": self.max_file_size,
-            "allowed_formats": self.allowed_formats,
+            "variants": cfg.variants,
+            # A fresh plain dict: json_script can't serialize a mappingproxy,
+            # and a per-render copy keeps context consumers off the original.
+            "metadata": dict(cfg.metadata),
+            "require_signed_urls": cfg.require_signed_urls,
+            "max_file_size": cfg.max_file_size,
+            "allowed_formats": cfg.allowed_formats,
             "api_endpoint": self._resolve_upload_endpoint(),
         }
 
@@ -147,25 +249,24 @@ class CloudflareImageWidget(forms.TextInput):
                 # not escape those characters and is an XSS footgun if a template
                 # drops it into a <script> tag.
                 "config": config,
-                # Individual values exposed for template convenience.
-                "variants": self.variants,
-                "metadata": self.metadata,
-                "require_signed_urls": self.require_signed_urls,
-                "max_file_size": self.max_file_size,
-                "allowed_formats": self.allowed_formats,
-                "api_endpoint": config["api_endpoint"],
+                # Individual values exposed for template convenience, taken
+                # from the same dict rather than re-listed key by key.
+                **config,
             }
         )
         return context
 
     def render(
         self, name: str, value: Any, attrs: dict[str, Any] | None = None, renderer=None
-    ) -> SafeText:
+    ) -> SafeString:
         """
         Render the widget HTML from the template.
 
-        Falls back to a minimal, equivalent markup block only if the package's
-        templates aren't reachable on the loader path.
+        Falls back to a minimal, equivalent markup block only if the widget's
+        own template isn't reachable on the loader path. Any other error --
+        including a ``TemplateDoesNotExist`` for a missing ``{% include %}``
+        inside a template that was found -- propagates instead of being masked
+        by the fallback.
         """
         if renderer is None:
             renderer = get_default_renderer()
@@ -173,10 +274,12 @@ class CloudflareImageWidget(forms.TextInput):
         context = self.get_context(name, value, attrs)
         try:
             return mark_safe(renderer.render(self.template_name, context))
-        except TemplateDoesNotExist:
+        except TemplateDoesNotExist as exc:
+            if exc.args[:1] != (self.template_name,):
+                raise
             return self._render_fallback(context)
 
-    def _render_fallback(self, context: dict[str, Any]) -> SafeText:
+    def _render_fallback(self, context: dict[str, Any]) -> SafeString:
         """
         Minimal fallback used only when the widget template can't be loaded.
 
@@ -193,18 +296,7 @@ class CloudflareImageWidget(forms.TextInput):
         config_script = json_script(widget["config"], widget["config_id"])
 
         return format_html(
-            '<div class="cloudflare-image-upload-container" '
-            'data-cfimg-field="{field_id}">'
-            '<input type="hidden" name="{name}" id="{field_id}" value="{value}" '
-            'class="cloudflare-image-field">'
-            '<input type="file" id="{upload_id}" accept="image/*" '
-            'class="cloudflare-image-upload">'
-            '<div id="{preview_id}" class="cloudflare-image-preview"></div>'
-            '<div id="{progress_id}" class="cloudflare-image-progress" '
-            'style="display: none;">'
-            '<div class="progress-bar"></div>'
-            '<span class="progress-text">Uploading…</span>'
-            "</div>{config_script}</div>",
+            _FALLBACK_HTML,
             field_id=widget["field_id"],
             name=widget["name"],
             value=widget["value"],
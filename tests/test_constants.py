@@ -30,7 +30,8 @@ def test_field_and_widget_default_to_shared_constant():
     from django_cloudflareimages_toolkit.widgets import CloudflareImageWidget
 
     assert CloudflareImageField().allowed_formats == DEFAULT_ALLOWED_FORMATS
-    assert CloudflareImageWidget().allowed_formats == DEFAULT_ALLOWED_FORMATS
+    # The widget freezes its copy into a tuple.
+    assert CloudflareImageWidget().allowed_formats == tuple(DEFAULT_ALLOWED_FORMATS)
 
 
 def test_field_default_does_not_alias_the_constant():
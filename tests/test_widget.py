@@ -9,10 +9,13 @@ and resolves the upload endpoint from its named route
 
 from __future__ import annotations
 
+import copy
 import json
+import pickle
 import re
 
 import pytest
+from django.template import TemplateDoesNotExist, TemplateSyntaxError
 from django.urls import reverse
 
 from django_cloudflareimages_toolkit.widgets import CloudflareImageWidget
@@ -82,6 +85,73 @@ def test_render_does_not_contain_dead_endpoints(dead):
     assert dead not in html
 
 
+def test_assigning_an_option_updates_the_config():
+    """Options set on a form's widget after construction reach the payload."""
+    widget = CloudflareImageWidget()
+    widget.max_file_size = 1024
+    widget.variants = ["thumb"]
+
+    config = widget._build_config()
+    assert config["max_file_size"] == 1024
+    assert list(config["variants"]) == ["thumb"]
+
+
+def test_widget_config_is_frozen_at_construction():
+    """Config inputs are copied into immutable containers, so mutating the
+    caller's objects (or the widget's attributes) can't change the payload."""
+    variants = ["thumb"]
+    metadata = {"k": "v"}
+    widget = CloudflareImageWidget(variants=variants, metadata=metadata)
+    variants.append("hero")
+    metadata["k"] = "changed"
+
+    assert widget.variants == ("thumb",)
+    assert widget.metadata == {"k": "v"}
+    with pytest.raises(TypeError):
+        widget.metadata["k"] = "x"  # type: ignore[index]
+    assert widget._build_config()["metadata"] == {"k": "v"}
+
+
+def test_widget_rejects_a_bare_string_of_names():
+    """A single str is not split into characters (``"thumb"`` -> ``t, h…``)."""
+    with pytest.raises(TypeError):
+        CloudflareImageWidget(variants="thumb")  # type: ignore[arg-type]
+
+    widget = CloudflareImageWidget()
+    with pytest.raises(TypeError):
+        widget.allowed_formats = "png"  # type: ignore[assignment]
+    widget.variants = widget.variants + ("thumb",)
+    assert widget.variants == ("thumb",)
+
+
+def test_widget_round_trips_through_pickle():
+    """Freezing must not cost picklability (forms and fields holding the
+    widget get pickled, e.g. by cache backends)."""
+    widget = CloudflareImageWidget(variants=["thumb"], metadata={"k": "v"})
+    restored = pickle.loads(pickle.dumps(widget))
+
+    assert restored.variants == ("thumb",)
+    assert restored.metadata == {"k": "v"}
+    assert restored._build_config() == widget._build_config()
+    assert pickle.loads(pickle.dumps(CloudflareImageWidget())).metadata == {}
+
+
+def test_context_metadata_does_not_leak_into_widget_copies():
+    """Each render hands out its own metadata dict: Django's
+    ``Widget.__deepcopy__`` shallow-copies the widget per form, so a shared
+    backing dict would let one form's context mutate every copy."""
+    widget = CloudflareImageWidget(metadata={"k": "v"})
+    copied = copy.deepcopy(widget)
+
+    context = widget.get_context("photo", None, {"id": "id_photo"})
+    context["widget"]["metadata"]["k"] = "leak"
+    context["widget"]["config"]["metadata"]["k"] = "leak"
+
+    assert widget.metadata == {"k": "v"}
+    assert copied.metadata == {"k": "v"}
+    assert copied._build_config()["metadata"] == {"k": "v"}
+
+
 def test_config_assembled_in_one_place():
     """get_context's config equals _build_config() — a single assembly point."""
     widget = CloudflareImageWidget(metadata={"k": "v"})
@@ -103,6 +173,55 @@ def test_fallback_renders_equivalent_markup_without_inline_flow():
     assert config["api_endpoint"] == UPLOAD_PATH
 
 
+def test_fallback_escapes_interpolated_values():
+    """The fallback HTML-escapes name/id/value like the template does, so an
+    odd image id or formset prefix can't break out of an attribute."""
+    widget = CloudflareImageWidget()
+    widget.template_name = "does/not/exist.html"  # force the fallback path
+    html = widget.render('x"><b>', 'cf"<id>', {"id": 'id_"x'})
+
+    assert '"><b>' not in html
+    assert 'cf"<id>' not in html
+    assert 'value="cf&quot;&lt;id&gt;"' in html
+    assert 'id="id_&quot;x"' in html
+
+
+def test_render_delegates_to_the_renderer():
+    """A FORM_RENDERER only has to implement ``render()``; the widget uses it
+    (and whatever it adds) rather than reaching for its template directly."""
+
+    class RenderOnly:
+        def render(self, template_name, context, request=None):
+            return f"<p>{template_name}</p>"
+
+    html = CloudflareImageWidget().render("photo", None, renderer=RenderOnly())
+    assert html == f"<p>{CloudflareImageWidget.template_name}</p>"
+
+
+def test_render_does_not_mask_errors_inside_a_found_template():
+    """Only a missing widget template triggers the fallback; a template that
+    loads but fails to render (e.g. a broken ``{% include %}``) surfaces."""
+
+    class Renderer:
+        def render(self, template_name, context, request=None):
+            raise TemplateDoesNotExist("partials/missing.html")
+
+    with pytest.raises(TemplateDoesNotExist):
+        CloudflareImageWidget().render("photo", None, renderer=Renderer())
+
+
+def test_render_does_not_mask_template_syntax_errors():
+    """The fallback catches TemplateDoesNotExist only; a broken override of
+    the widget template errors loudly instead of silently degrading."""
+
+    class Renderer:
+        def render(self, template_name, context, request=None):
+            raise TemplateSyntaxError("Invalid block tag")
+
+    with pytest.raises(TemplateSyntaxError):
+        CloudflareImageWidget().render("photo", None, renderer=Renderer())
+
+
 def test_media_references_static_assets():
     media = str(CloudflareImageWidget().media)
     assert "django_cloudflareimages_toolkit/js/cloudflare_image_widget.js" in media